@@ -3,14 +3,16 @@
 import sys
 from pathlib import Path
 
+project_root = Path(__file__).parent
+
 # Add src to path
-sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(project_root))
 
 from src.main import main
 
 if __name__ == '__main__':
     # Run with sample DMA controller report
-    sample_report = Path(__file__).parent / 'sample_reports' / 'dma_controller_coverage.txt'
+    sample_report = project_root / 'sample_reports' / 'dma_controller_coverage.txt'
     
     if not sample_report.exists():
         print(f"Error: Sample report not found at {sample_report}")
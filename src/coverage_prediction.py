@@ -6,13 +6,41 @@ This module predicts coverage closure metrics including:
 - Identification of potentially blocking bins
 """
 
+from collections import Counter
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from src.parser import CoverageReport
 from src.llm_integration import TestSuggestion, DifficultyLevel
+from src.prioritization import SuggestionStats
 
 
-@dataclass
+# Penalty weight per difficulty level (unknown levels default to 0.5)
+_DIFFICULTY_PENALTY = {
+    DifficultyLevel.EASY: 0.1,
+    DifficultyLevel.MEDIUM: 0.3,
+    DifficultyLevel.HARD: 0.6,
+    DifficultyLevel.VERY_HARD: 0.9
+}
+
+# Reason/severity fields merged into each blocking bin entry
+_REASON_NO_SUGG = {'reason': 'No test suggestion generated', 'severity': 'medium'}
+_REASON_HARD_DEPS = {'reason': 'Very hard test with multiple dependencies', 'severity': 'high'}
+
+# Ranking used to keep the most severe reason when a bin is flagged twice
+_SEVERITY_RANK = {'medium': 1, 'high': 2}
+
+
+def _bin_key(bin_info: Dict[str, Any]) -> Tuple[Any, Any, str]:
+    """Identify a bin by covergroup, coverpoint and name, since bin names repeat"""
+    return (bin_info.get('covergroup'), bin_info.get('coverpoint'), bin_info.get('bin', ''))
+
+
+def _clamp(value: float, low: float, high: float) -> float:
+    """Clamp value to the closed interval [low, high]"""
+    return low if value < low else high if value > high else value
+
+
+@dataclass(slots=True)
 class CoveragePrediction:
     """Coverage closure prediction results"""
     estimated_time_to_100_percent_hours: float
@@ -22,6 +50,15 @@ class CoveragePrediction:
     confidence_level: str  # "high", "medium", "low"
 
 
+@dataclass(slots=True)
+class _PredictionContext:
+    """Per-call values shared by the predictor helpers"""
+    total_uncovered: int
+    total_time_hours: float
+    difficulty_counts: Dict[DifficultyLevel, int]
+    suggestions_by_bin: Dict[Tuple[Any, Any, str], TestSuggestion]
+
+
 class CoverageClosurePredictor:
     """Predicts coverage closure metrics"""
     
@@ -33,7 +70,9 @@ class CoverageClosurePredictor:
         self,
         coverage_report: CoverageReport,
         test_suggestions: List[TestSuggestion],
-        historical_data: Optional[Dict] = None
+        historical_data: Optional[Dict] = None,
+        *,
+        stats: Optional[SuggestionStats] = None
     ) -> CoveragePrediction:
         """
         Predict coverage closure metrics
@@ -42,37 +81,56 @@ class CoverageClosurePredictor:
             coverage_report: Current coverage report
             test_suggestions: Generated test suggestions
             historical_data: Optional historical coverage closure data
+            stats: Optional statistics from prioritize_suggestions for the
+                same suggestions, saving a recount of times and difficulties
         
         Returns:
             CoveragePrediction object with predictions
         """
+        # Fully covered design: nothing left to predict
+        if not coverage_report.uncovered_bins and not coverage_report.uncovered_crosses:
+            return CoveragePrediction(
+                estimated_time_to_100_percent_hours=0.0,
+                likelihood_of_100_percent=1.0,
+                blocking_bins=[],
+                predicted_final_coverage=100.0,
+                confidence_level="high"
+            )
+        
+        # Compute report-derived values once and share them with every helper
+        ctx = self._build_context(coverage_report, test_suggestions, stats)
+        
         # Calculate estimated time to 100% coverage
-        estimated_time = self._estimate_time_to_full_coverage(test_suggestions)
+        estimated_time = self._estimate_time_to_full_coverage(test_suggestions, ctx)
         
         # Predict likelihood of achieving 100% coverage
         likelihood = self._predict_100_percent_likelihood(
             coverage_report,
-            test_suggestions
+            test_suggestions,
+            ctx
         )
         
         # Identify blocking bins
         blocking_bins = self._identify_blocking_bins(
             coverage_report,
-            test_suggestions
+            test_suggestions,
+            ctx
         )
         
         # Predict final achievable coverage
         predicted_final_coverage = self._predict_final_coverage(
             coverage_report,
             test_suggestions,
-            blocking_bins
+            blocking_bins,
+            ctx
         )
         
         # Determine confidence level
         confidence = self._determine_confidence(
             coverage_report,
             test_suggestions,
-            blocking_bins
+            blocking_bins,
+            ctx
         )
         
         return CoveragePrediction(
@@ -83,9 +141,44 @@ class CoverageClosurePredictor:
             confidence_level=confidence
         )
     
+    def _build_context(
+        self,
+        coverage_report: CoverageReport,
+        test_suggestions: List[TestSuggestion],
+        stats: Optional[SuggestionStats] = None
+    ) -> _PredictionContext:
+        """
+        Collect the values used by the helpers
+        
+        Suggestion statistics (total time, difficulty histogram and the
+        per-bin index) are gathered in a single pass over the suggestions.
+        When precomputed stats are supplied only the index is built.
+        """
+        suggestions_by_bin: Dict[Tuple[Any, Any, str], TestSuggestion] = {}
+        if stats is not None:
+            total_time = stats.total_time_hours
+            difficulty_counts = stats.difficulty_counts
+            for s in test_suggestions:
+                suggestions_by_bin.setdefault(_bin_key(s.uncovered_bin), s)
+        else:
+            total_time = 0.0
+            difficulty_counts = Counter()
+            for s in test_suggestions:
+                total_time += s.estimated_time_hours
+                difficulty_counts[s.difficulty] += 1
+                suggestions_by_bin.setdefault(_bin_key(s.uncovered_bin), s)
+        
+        return _PredictionContext(
+            total_uncovered=len(coverage_report.uncovered_bins) + len(coverage_report.uncovered_crosses),
+            total_time_hours=total_time,
+            difficulty_counts=difficulty_counts,
+            suggestions_by_bin=suggestions_by_bin
+        )
+    
     def _estimate_time_to_full_coverage(
         self,
-        test_suggestions: List[TestSuggestion]
+        test_suggestions: List[TestSuggestion],
+        ctx: _PredictionContext
     ) -> float:
         """
         Estimate time to reach 100% coverage based on test suggestions
@@ -95,8 +188,8 @@ class CoverageClosurePredictor:
         if not test_suggestions:
             return 0.0
         
-        # Sum up estimated time from all suggestions
-        total_time = sum(s.estimated_time_hours for s in test_suggestions)
+        # Estimated time from all suggestions, summed while building the context
+        total_time = ctx.total_time_hours
         
         # Add overhead factor (20% for integration, debugging, etc.)
         overhead_factor = 1.2
@@ -106,7 +199,8 @@ class CoverageClosurePredictor:
     def _predict_100_percent_likelihood(
         self,
         coverage_report: CoverageReport,
-        test_suggestions: List[TestSuggestion]
+        test_suggestions: List[TestSuggestion],
+        ctx: _PredictionContext
     ) -> float:
         """
         Predict likelihood of achieving 100% coverage
@@ -116,9 +210,7 @@ class CoverageClosurePredictor:
         - Difficulty distribution of suggestions
         - Presence of blocking bins
         """
-        uncovered_bins_count = len(coverage_report.uncovered_bins)
-        uncovered_crosses_count = len(coverage_report.uncovered_crosses)
-        total_uncovered = uncovered_bins_count + uncovered_crosses_count
+        total_uncovered = ctx.total_uncovered
         
         if total_uncovered == 0:
             return 1.0
@@ -130,31 +222,31 @@ class CoverageClosurePredictor:
         suggestion_ratio = min(1.0, len(test_suggestions) / total_uncovered)
         
         # Adjust based on difficulty distribution
-        difficulty_penalty = self._calculate_difficulty_penalty(test_suggestions)
+        difficulty_penalty = self._calculate_difficulty_penalty(test_suggestions, ctx)
         
         # Adjust based on current coverage (higher current coverage = higher likelihood)
         current_coverage_factor = coverage_report.overall_coverage / 100.0
         
-        # Combine factors
-        likelihood = suggestion_ratio * (1.0 - difficulty_penalty) * (0.5 + 0.5 * current_coverage_factor)
-        
-        return min(1.0, max(0.0, likelihood))
+        # Combine factors and clamp in one step
+        return _clamp(
+            suggestion_ratio * (1.0 - difficulty_penalty) * (0.5 + 0.5 * current_coverage_factor),
+            0.0,
+            1.0
+        )
     
-    def _calculate_difficulty_penalty(self, suggestions: List[TestSuggestion]) -> float:
+    def _calculate_difficulty_penalty(
+        self,
+        suggestions: List[TestSuggestion],
+        ctx: _PredictionContext
+    ) -> float:
         """Calculate penalty based on test difficulty"""
         if not suggestions:
             return 0.0
         
-        difficulty_weights = {
-            DifficultyLevel.EASY: 0.1,
-            DifficultyLevel.MEDIUM: 0.3,
-            DifficultyLevel.HARD: 0.6,
-            DifficultyLevel.VERY_HARD: 0.9
-        }
-        
+        # Weight each level of the difficulty histogram once
         total_penalty = sum(
-            difficulty_weights.get(s.difficulty, 0.5)
-            for s in suggestions
+            _DIFFICULTY_PENALTY.get(difficulty, 0.5) * count
+            for difficulty, count in ctx.difficulty_counts.items()
         )
         
         return total_penalty / len(suggestions)
@@ -162,7 +254,8 @@ class CoverageClosurePredictor:
     def _identify_blocking_bins(
         self,
         coverage_report: CoverageReport,
-        test_suggestions: List[TestSuggestion]
+        test_suggestions: List[TestSuggestion],
+        ctx: _PredictionContext
     ) -> List[Dict[str, Any]]:
         """
         Identify potentially blocking bins that may be impossible to cover
@@ -173,49 +266,39 @@ class CoverageClosurePredictor:
         - No test suggestion exists for it
         - It's been uncovered for a long time (if historical data available)
         """
-        blocking_bins = []
-        
-        # Check uncovered bins without suggestions
-        uncovered_bin_names = {
-            bin_info.get('bin', '') for bin_info in coverage_report.uncovered_bins
-        }
+        if not coverage_report.uncovered_bins:
+            return []
         
-        suggested_bin_names = {
-            s.uncovered_bin.get('bin', '') for s in test_suggestions
-        }
-        
-        unsuggested_bins = uncovered_bin_names - suggested_bin_names
+        # Keyed by bin identity so a bin listed more than once is reported once
+        blocking: Dict[Tuple[Any, Any, str], Dict[str, Any]] = {}
+        sugg_by_bin = ctx.suggestions_by_bin
         
         for bin_info in coverage_report.uncovered_bins:
-            bin_name = bin_info.get('bin', '')
+            key = _bin_key(bin_info)
+            suggestion = sugg_by_bin.get(key)
             
             # Check if bin has no suggestion
-            if bin_name in unsuggested_bins:
-                blocking_bins.append({
-                    **bin_info,
-                    'reason': 'No test suggestion generated',
-                    'severity': 'medium'
-                })
-            
+            if suggestion is None:
+                entry = bin_info | _REASON_NO_SUGG
             # Check for very hard suggestions with many dependencies
-            for suggestion in test_suggestions:
-                if suggestion.uncovered_bin.get('bin') == bin_name:
-                    if (suggestion.difficulty == DifficultyLevel.VERY_HARD and
-                        len(suggestion.dependencies) >= 3):
-                        blocking_bins.append({
-                            **bin_info,
-                            'reason': 'Very hard test with multiple dependencies',
-                            'severity': 'high'
-                        })
-                    break
-        
-        return blocking_bins
+            elif suggestion.difficulty == DifficultyLevel.VERY_HARD and len(suggestion.dependencies) >= 3:
+                entry = bin_info | _REASON_HARD_DEPS
+            else:
+                continue
+            
+            current = blocking.get(key)
+            if (current is None or
+                _SEVERITY_RANK[entry['severity']] > _SEVERITY_RANK[current['severity']]):
+                blocking[key] = entry
+        
+        return list(blocking.values())
     
     def _predict_final_coverage(
         self,
         coverage_report: CoverageReport,
         test_suggestions: List[TestSuggestion],
-        blocking_bins: List[Dict]
+        blocking_bins: List[Dict],
+        ctx: _PredictionContext
     ) -> float:
         """
         Predict final achievable coverage percentage
@@ -225,29 +308,26 @@ class CoverageClosurePredictor:
         current_coverage = coverage_report.overall_coverage
         
         # Calculate potential coverage gain from suggestions
-        total_uncovered_bins = len(coverage_report.uncovered_bins) + len(coverage_report.uncovered_crosses)
+        total_uncovered_bins = ctx.total_uncovered
         
         if total_uncovered_bins == 0:
             return 100.0
         
         # Estimate bins that can be covered
-        coverable_bins = total_uncovered_bins - len(blocking_bins)
+        coverable_bins = max(0, total_uncovered_bins - len(blocking_bins))
         
         # Assume each bin contributes equally to coverage
         # This is a simplification - in reality, bins may have different weights
         coverage_per_bin = (100.0 - current_coverage) / total_uncovered_bins
         
-        predicted_gain = coverable_bins * coverage_per_bin
-        
-        predicted_final = min(100.0, current_coverage + predicted_gain)
-        
-        return predicted_final
+        return _clamp(current_coverage + coverable_bins * coverage_per_bin, 0.0, 100.0)
     
     def _determine_confidence(
         self,
         coverage_report: CoverageReport,
         test_suggestions: List[TestSuggestion],
-        blocking_bins: List[Dict]
+        blocking_bins: List[Dict],
+        ctx: _PredictionContext
     ) -> str:
         """
         Determine confidence level of predictions
@@ -256,7 +336,7 @@ class CoverageClosurePredictor:
         Medium: Moderate suggestions, some blocking bins
         Low: Few suggestions, many blocking bins, low current coverage
         """
-        uncovered_count = len(coverage_report.uncovered_bins) + len(coverage_report.uncovered_crosses)
+        uncovered_count = ctx.total_uncovered
         
         if uncovered_count == 0:
             return "high"
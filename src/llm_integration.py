@@ -6,7 +6,8 @@ intelligent test suggestions based on uncovered coverage bins.
 
 import os
 import json
-from typing import Dict, List, Optional, Any
+from itertools import islice
+from typing import Dict, Iterable, List, Optional, Any
 from dataclasses import dataclass, asdict
 from enum import Enum
 from dotenv import load_dotenv
@@ -35,7 +36,7 @@ class DifficultyLevel(Enum):
     VERY_HARD = "very_hard"
 
 
-@dataclass
+@dataclass(slots=True)
 class TestSuggestion:
     """Represents a test suggestion generated by LLM"""
     uncovered_bin: Dict[str, Any]
@@ -81,7 +82,7 @@ class LLMTestGenerator:
     
     def generate_suggestions(
         self,
-        uncovered_bins: List[Dict[str, Any]],
+        uncovered_bins: Iterable[Dict[str, Any]],
         design_name: str,
         design_context: Optional[str] = None,
         max_suggestions: Optional[int] = None
@@ -90,7 +91,7 @@ class LLMTestGenerator:
         Generate test suggestions for uncovered bins
         
         Args:
-            uncovered_bins: List of uncovered bin dictionaries
+            uncovered_bins: Uncovered bin dictionaries (any iterable, consumed once)
             design_name: Name of the design/IP under test
             design_context: Optional context about the design
             max_suggestions: Maximum number of suggestions to generate
@@ -99,7 +100,8 @@ class LLMTestGenerator:
             List of TestSuggestion objects
         """
         suggestions = []
-        bins_to_process = uncovered_bins[:max_suggestions] if max_suggestions else uncovered_bins
+        # islice stops early without copying, and also accepts lazy iterators
+        bins_to_process = islice(uncovered_bins, max_suggestions) if max_suggestions else uncovered_bins
         
         for bin_info in bins_to_process:
             suggestion = self._generate_single_suggestion(bin_info, design_name, design_context)
@@ -269,14 +271,14 @@ class MockLLMGenerator:
     
     def generate_suggestions(
         self,
-        uncovered_bins: List[Dict[str, Any]],
+        uncovered_bins: Iterable[Dict[str, Any]],
         design_name: str,
         design_context: Optional[str] = None,
         max_suggestions: Optional[int] = None
     ) -> List[TestSuggestion]:
         """Generate mock test suggestions"""
         suggestions = []
-        bins_to_process = uncovered_bins[:max_suggestions] if max_suggestions else uncovered_bins
+        bins_to_process = islice(uncovered_bins, max_suggestions) if max_suggestions else uncovered_bins
         
         for bin_info in bins_to_process:
             suggestion = TestSuggestion(
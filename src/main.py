@@ -3,27 +3,49 @@
 Command-line interface for the Verification Coverage Analyzer
 """
 
+import dataclasses
+import functools
 import json
 import os
 import sys
 from pathlib import Path
 from typing import Optional
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
 
-from src.parser import CoverageReportParser, parse_coverage_report
-from src.llm_integration import LLMTestGenerator, MockLLMGenerator
-from src.prioritization import prioritize_suggestions
-from src.coverage_prediction import CoverageClosurePredictor
+# Prefer orjson for writing results; fall back to the standard library
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Rich and the analysis modules are imported where they are first needed,
+# so that short invocations such as --help start quickly
 
-# Initialize console with Windows-compatible settings
-import os
 if sys.platform == 'win32':
     # Set UTF-8 encoding for Windows
     os.environ['PYTHONIOENCODING'] = 'utf-8'
-console = Console(legacy_windows=False)
+
+
+# Rich style used for each difficulty level in the suggestions table
+_DIFF_COLORS = {
+    'easy': 'green',
+    'medium': 'yellow',
+    'hard': 'red',
+    'very_hard': 'bold red'
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_console(stderr=False):
+    """Create the shared console with Windows-compatible settings on first use"""
+    from rich.console import Console
+    return Console(stderr=stderr, legacy_windows=False)
+
+
+def _error_console(quiet):
+    """Get the console for error messages, which is stderr in quiet mode"""
+    return _get_console(stderr=True) if quiet else _get_console()
 
 
 @click.command()
@@ -40,6 +62,12 @@ console = Console(legacy_windows=False)
               help='Enable coverage closure prediction (bonus feature)')
 @click.option('--priority-weights', nargs=3, type=float, default=[0.5, 0.3, 0.2],
               help='Priority weights: coverage_impact difficulty dependency')
+@click.option('--fast-output/--pretty', default=False,
+              help='Print suggestions and predictions as plain text instead of Rich tables')
+@click.option('--quiet/--no-quiet', default=False,
+              help='Only write the JSON results; skip all console output except errors')
+@click.option('--top-k', type=click.IntRange(min=1), default=None,
+              help='Display only the K highest-priority suggestions (prediction and output use all)')
 def main(
     coverage_report: str,
     output: Optional[str],
@@ -48,124 +76,217 @@ def main(
     max_suggestions: Optional[int],
     design_context: Optional[str],
     enable_prediction: bool,
-    priority_weights: tuple
+    priority_weights: tuple,
+    fast_output: bool,
+    quiet: bool,
+    top_k: Optional[int]
 ):
     """Verification Coverage Analyzer with LLM Integration
     
     Analyzes functional coverage reports and generates prioritized test suggestions
     to close coverage gaps.
     """
-    console.print(Panel.fit(
-        "[bold blue]Verification Coverage Analyzer[/bold blue]\n"
-        "AI-Assisted Functional Coverage Closure",
-        border_style="blue"
-    ))
+    from src.parser import parse_coverage_report_cached
+    from src.llm_integration import LLMTestGenerator, MockLLMGenerator
+    from src.prioritization import prioritize_suggestions
+    
+    report_path = Path(coverage_report)
+    
+    # The stdout console is only created outside quiet mode
+    if not quiet:
+        from rich.panel import Panel
+        _get_console().print(Panel.fit(
+            "[bold blue]Verification Coverage Analyzer[/bold blue]\n"
+            "AI-Assisted Functional Coverage Closure",
+            border_style="blue"
+        ))
+        
+        _get_console().print(f"\n[cyan]Parsing coverage report:[/cyan] {coverage_report}")
     
     # Parse coverage report
-    console.print(f"\n[cyan]Parsing coverage report:[/cyan] {coverage_report}")
     try:
-        report = parse_coverage_report(coverage_report)
-        console.print("[green]Parsing complete[/green]")
+        report = parse_coverage_report_cached(report_path)
+        if not quiet:
+            _get_console().print("[green]Parsing complete[/green]")
     except Exception as e:
-        console.print(f"[red]Error parsing report:[/red] {e}")
+        _error_console(quiet).print(f"[red]Error parsing report:[/red] {e}")
         sys.exit(1)
     
-    # Display coverage summary
-    _display_coverage_summary(report)
+    if not quiet:
+        # Display coverage summary
+        _display_coverage_summary(report)
+        
+        _get_console().print(f"\n[cyan]Generating test suggestions...[/cyan]")
+        _get_console().print(f"LLM Provider: {llm_provider}")
     
     # Generate test suggestions
-    console.print(f"\n[cyan]Generating test suggestions...[/cyan]")
-    console.print(f"LLM Provider: {llm_provider}")
-    
     try:
         if llm_provider == 'mock':
             generator = MockLLMGenerator()
         else:
             generator = LLMTestGenerator(provider=llm_provider, model=llm_model)
         
-        console.print("[yellow]Generating suggestions...[/yellow]")
+        if not quiet:
+            _get_console().print("[yellow]Generating suggestions...[/yellow]")
         suggestions = generator.generate_suggestions(
             uncovered_bins=report.uncovered_bins,
             design_name=report.design_name,
             design_context=design_context,
             max_suggestions=max_suggestions
         )
-        console.print("[green]Suggestions generated[/green]")
-        
-        console.print(f"[green]Generated {len(suggestions)} test suggestions[/green]")
+        if not quiet:
+            _get_console().print("[green]Suggestions generated[/green]")
+            
+            _get_console().print(f"[green]Generated {len(suggestions)} test suggestions[/green]")
     
     except Exception as e:
-        console.print(f"[red]Error generating suggestions:[/red] {e}")
+        _error_console(quiet).print(f"[red]Error generating suggestions:[/red] {e}")
         sys.exit(1)
     
     # Prioritize suggestions
-    console.print(f"\n[cyan]Prioritizing test suggestions...[/cyan]")
-    prioritized = prioritize_suggestions(
+    if not quiet:
+        _get_console().print(f"\n[cyan]Prioritizing test suggestions...[/cyan]")
+    prioritized, suggestion_stats = prioritize_suggestions(
         suggestions,
         coverage_impact_weight=priority_weights[0],
         difficulty_weight=priority_weights[1],
-        dependency_weight=priority_weights[2]
+        dependency_weight=priority_weights[2],
+        return_stats=True
     )
     
     # Display prioritized suggestions
-    _display_suggestions(prioritized)
+    if not quiet:
+        _display_suggestions(prioritized, fast_output, top_k)
     
     # Coverage prediction (optional)
     prediction = None
     if enable_prediction:
-        console.print(f"\n[cyan]Predicting coverage closure...[/cyan]")
+        from src.coverage_prediction import CoverageClosurePredictor
         predictor = CoverageClosurePredictor()
-        console.print("[yellow]Calculating predictions...[/yellow]")
-        prediction = predictor.predict(report, prioritized)
-        console.print("[green]Predictions complete[/green]")
-        
-        _display_prediction(prediction)
+        if not quiet:
+            _get_console().print(f"\n[cyan]Predicting coverage closure...[/cyan]")
+            _get_console().print("[yellow]Calculating predictions...[/yellow]")
+        prediction = predictor.predict(report, prioritized, stats=suggestion_stats)
+        if not quiet:
+            _get_console().print("[green]Predictions complete[/green]")
+            
+            _display_prediction(prediction, fast_output)
     
     # Prepare output
-    output_data = {
-        'coverage_report': {
-            'design_name': report.design_name,
-            'overall_coverage': report.overall_coverage,
-            'uncovered_bins_count': len(report.uncovered_bins),
-            'uncovered_crosses_count': len(report.uncovered_crosses)
-        },
-        'test_suggestions': [
-            {
-                'uncovered_bin': s.uncovered_bin,
-                'description': s.description,
-                'test_outline': s.test_outline,
-                'difficulty': s.difficulty.value,
-                'dependencies': s.dependencies,
-                'reasoning': s.reasoning,
-                'estimated_time_hours': s.estimated_time_hours,
-                'priority_score': s.priority_score
-            }
-            for s in prioritized
-        ],
-        'prediction': {
-            'estimated_time_to_100_percent_hours': prediction.estimated_time_to_100_percent_hours,
-            'likelihood_of_100_percent': prediction.likelihood_of_100_percent,
-            'blocking_bins': prediction.blocking_bins,
-            'predicted_final_coverage': prediction.predicted_final_coverage,
-            'confidence_level': prediction.confidence_level
-        } if prediction else None
+    report_summary = {
+        'design_name': report.design_name,
+        'overall_coverage': report.overall_coverage,
+        'uncovered_bins_count': len(report.uncovered_bins),
+        'uncovered_crosses_count': len(report.uncovered_crosses)
     }
+    prediction_data = {
+        'estimated_time_to_100_percent_hours': prediction.estimated_time_to_100_percent_hours,
+        'likelihood_of_100_percent': prediction.likelihood_of_100_percent,
+        'blocking_bins': prediction.blocking_bins,
+        'predicted_final_coverage': prediction.predicted_final_coverage,
+        'confidence_level': prediction.confidence_level
+    } if prediction else None
     
     # Save output
     if output:
-        with open(output, 'w') as f:
-            json.dump(output_data, f, indent=2)
-        console.print(f"\n[green]Results saved to:[/green] {output}")
+        _write_results(output, report_summary, prioritized, prediction_data)
+        if not quiet:
+            _get_console().print(f"\n[green]Results saved to:[/green] {output}")
     else:
         # Save to default location
-        default_output = Path(coverage_report).stem + '_analysis.json'
-        with open(default_output, 'w') as f:
-            json.dump(output_data, f, indent=2)
-        console.print(f"\n[green]Results saved to:[/green] {default_output}")
+        default_output = report_path.stem + '_analysis.json'
+        _write_results(default_output, report_summary, prioritized, prediction_data)
+        if not quiet:
+            _get_console().print(f"\n[green]Results saved to:[/green] {default_output}")
+
+
+# Keys of each test suggestion in the JSON output, in output order
+_SUGGESTION_KEYS = (
+    'uncovered_bin',
+    'description',
+    'test_outline',
+    'difficulty',
+    'dependencies',
+    'reasoning',
+    'estimated_time_hours',
+    'priority_score'
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _encodes_as_schema(suggestion_type):
+    """
+    Check that orjson's encoding of suggestion_type matches the output schema
+    
+    orjson writes a dataclass as its fields in declaration order, so direct
+    encoding is only used while those fields are exactly _SUGGESTION_KEYS.
+    """
+    return tuple(f.name for f in dataclasses.fields(suggestion_type)) == _SUGGESTION_KEYS
+
+
+def _suggestion_to_dict(suggestion):
+    """
+    Convert a test suggestion to its JSON output mapping
+    
+    This mapping defines the output schema (see _SUGGESTION_KEYS) and is used
+    whenever the suggestion is not encoded directly by orjson.
+    """
+    return {
+        'uncovered_bin': suggestion.uncovered_bin,
+        'description': suggestion.description,
+        'test_outline': suggestion.test_outline,
+        'difficulty': suggestion.difficulty.value,
+        'dependencies': suggestion.dependencies,
+        'reasoning': suggestion.reasoning,
+        'estimated_time_hours': suggestion.estimated_time_hours,
+        'priority_score': suggestion.priority_score
+    }
+
+
+def _dumps_nested(obj, level):
+    """
+    Serialize obj as indented UTF-8 JSON bytes nested `level` levels deep
+    
+    Both encoders write non-ASCII text unescaped; float formatting can
+    still differ slightly between them (e.g. 1e-07 vs 1e-7).
+    """
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return data.replace(b'\n', b'\n' + b'  ' * level)
+
+
+def _write_results(path, report_summary, suggestions, prediction_data):
+    """
+    Write analysis results to path as indented JSON
+    
+    Test suggestions are encoded and written one at a time, so the full
+    list of suggestion dicts is never held in memory.
+    """
+    with open(path, 'wb') as f:
+        f.write(b'{\n  "coverage_report": ')
+        f.write(_dumps_nested(report_summary, 1))
+        f.write(b',\n  "test_suggestions": [')
+        for idx, suggestion in enumerate(suggestions):
+            f.write(b',\n    ' if idx else b'\n    ')
+            # orjson encodes the dataclass and its enum natively, no dict needed
+            if ORJSON_AVAILABLE and _encodes_as_schema(type(suggestion)):
+                record = suggestion
+            else:
+                record = _suggestion_to_dict(suggestion)
+            f.write(_dumps_nested(record, 2))
+        f.write(b'\n  ]' if suggestions else b']')
+        f.write(b',\n  "prediction": ')
+        f.write(_dumps_nested(prediction_data, 1))
+        f.write(b'\n}')
 
 
 def _display_coverage_summary(report):
     """Display coverage summary table"""
+    from rich.table import Table
+    
+    console = _get_console()
     table = Table(title="Coverage Summary", show_header=True, header_style="bold magenta")
     table.add_column("Metric", style="cyan")
     table.add_column("Value", style="green")
@@ -179,8 +300,57 @@ def _display_coverage_summary(report):
     console.print(table)
 
 
-def _display_suggestions(suggestions):
+def _format_plain_table(title, headers, rows, right_aligned=()):
+    """Format rows as a plain text table with aligned columns"""
+    widths = [
+        max([len(header)] + [len(row[col]) for row in rows])
+        for col, header in enumerate(headers)
+    ]
+    
+    def format_row(cells):
+        return ' '.join(
+            cell.rjust(width) if col in right_aligned else cell.ljust(width)
+            for col, (cell, width) in enumerate(zip(cells, widths))
+        ).rstrip()
+    
+    lines = [title, format_row(headers), ' '.join('-' * width for width in widths)]
+    lines.extend(format_row(row) for row in rows)
+    return '\n'.join(lines) + '\n'
+
+
+def _display_suggestions(suggestions, fast_output=False, top_k=None):
     """Display prioritized test suggestions"""
+    # Suggestions arrive sorted by priority, so the top K are a prefix
+    shown = suggestions[:top_k] if top_k else suggestions[:20]
+    
+    if fast_output:
+        rows = []
+        for idx, suggestion in enumerate(shown, 1):
+            bin_info = suggestion.uncovered_bin
+            description = suggestion.description
+            rows.append((
+                str(idx),
+                bin_info.get('coverpoint', 'N/A'),
+                bin_info.get('bin', 'N/A'),
+                description[:40] + '...' if len(description) > 40 else description,
+                suggestion.difficulty.value,
+                f"{suggestion.estimated_time_hours:.1f}",
+                f"{suggestion.priority_score:.3f}"
+            ))
+        text = _format_plain_table(
+            "Prioritized Test Suggestions",
+            ("Priority", "Coverpoint", "Bin", "Description", "Difficulty", "Time (hrs)", "Score"),
+            rows,
+            right_aligned=(0, 5, 6)
+        )
+        if len(shown) < len(suggestions):
+            text += f"\nShowing top {len(shown)} of {len(suggestions)} suggestions\n"
+        sys.stdout.write(text)
+        return
+    
+    from rich.table import Table
+    
+    console = _get_console()
     table = Table(title="Prioritized Test Suggestions", show_header=True, header_style="bold magenta")
     table.add_column("Priority", style="cyan", justify="right")
     table.add_column("Coverpoint", style="yellow")
@@ -190,33 +360,60 @@ def _display_suggestions(suggestions):
     table.add_column("Time (hrs)", style="blue", justify="right")
     table.add_column("Score", style="magenta", justify="right")
     
-    for idx, suggestion in enumerate(suggestions[:20], 1):  # Show top 20
+    for idx, suggestion in enumerate(shown, 1):
         bin_info = suggestion.uncovered_bin
-        difficulty_color = {
-            'easy': 'green',
-            'medium': 'yellow',
-            'hard': 'red',
-            'very_hard': 'bold red'
-        }.get(suggestion.difficulty.value, 'white')
+        description = suggestion.description
+        difficulty = suggestion.difficulty.value
+        color = _DIFF_COLORS.get(difficulty, 'white')
         
-        table.add_row(
+        row = (
             str(idx),
             bin_info.get('coverpoint', 'N/A'),
             bin_info.get('bin', 'N/A'),
-            suggestion.description[:40] + '...' if len(suggestion.description) > 40 else suggestion.description,
-            f"[{difficulty_color}]{suggestion.difficulty.value}[/{difficulty_color}]",
+            description[:40] + '...' if len(description) > 40 else description,
+            f"[{color}]{difficulty}[/{color}]",
             f"{suggestion.estimated_time_hours:.1f}",
             f"{suggestion.priority_score:.3f}"
         )
+        table.add_row(*row)
     
     console.print(table)
     
-    if len(suggestions) > 20:
-        console.print(f"\n[yellow]Showing top 20 of {len(suggestions)} suggestions[/yellow]")
+    if len(shown) < len(suggestions):
+        console.print(f"\n[yellow]Showing top {len(shown)} of {len(suggestions)} suggestions[/yellow]")
 
 
-def _display_prediction(prediction):
+def _display_prediction(prediction, fast_output=False):
     """Display coverage closure prediction"""
+    if fast_output:
+        text = (
+            "Coverage Closure Prediction\n"
+            f"Estimated Time to 100% Coverage: {prediction.estimated_time_to_100_percent_hours:.1f} hours\n"
+            f"Likelihood of Achieving 100%: {prediction.likelihood_of_100_percent * 100:.1f}%\n"
+            f"Predicted Final Coverage: {prediction.predicted_final_coverage:.2f}%\n"
+            f"Confidence Level: {prediction.confidence_level.upper()}\n"
+            f"Blocking Bins: {len(prediction.blocking_bins)}\n"
+        )
+        if prediction.blocking_bins:
+            rows = [
+                (
+                    bin_info.get('coverpoint', 'N/A'),
+                    bin_info.get('bin', 'N/A'),
+                    bin_info.get('reason', 'N/A'),
+                    bin_info.get('severity', 'N/A')
+                )
+                for bin_info in prediction.blocking_bins[:10]  # Show top 10
+            ]
+            text += "\n" + _format_plain_table(
+                "Blocking Bins", ("Coverpoint", "Bin", "Reason", "Severity"), rows
+            )
+        sys.stdout.write(text)
+        return
+    
+    from rich.panel import Panel
+    from rich.table import Table
+    
+    console = _get_console()
     panel_content = f"""
 [bold]Coverage Closure Prediction[/bold]
 
@@ -5,12 +5,56 @@ structured information including design name, coverage percentages, covergroups,
 coverpoints, bins, hit counts, and coverage status.
 """
 
+import functools
+import hashlib
+import os
+import pickle
 import re
+import sys
 import json
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+import mmap
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Any, TextIO, Tuple, Union
+from dataclasses import dataclass, fields, is_dataclass
 from enum import Enum
 
+# Prefer orjson for JSON output; fall back to the standard library
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# On-disk cache of parsed reports, keyed by the SHA-256 of the report file.
+# Bump _CACHE_VERSION whenever the parsed structure changes so that stale
+# entries are ignored (and removed the next time a new entry is written).
+_CACHE_DIR = Path.home() / '.cache' / 'cov_analyzer'
+_CACHE_VERSION = 5
+
+# Patterns are compiled once at import time and shared by every parser.
+_DESIGN_NAME_RE = re.compile(r'Design[^\S\n]*:[^\S\n]*(.+)', re.IGNORECASE)
+_OVERALL_LABEL_RE = re.compile(r'Overall Coverage|Total Coverage')
+_COVERAGE_PCT_RE = re.compile(r'(\d+\.?\d*)\s*%')
+# Single scanner for all covergroup/coverpoint/bin/cross tokens.
+# [^\S\n] is whitespace other than newline, so tokens never span lines.
+# The leading lookahead rejects most positions with one character-class
+# test before any of the alternatives is tried. With it in place, IGNORECASE
+# costs only a few percent, and lower-casing the report up front to drop the
+# flag saves nothing once the extra copy is counted, so keyword casing is
+# still accepted as-is.
+_TOKEN_RE = re.compile(
+    r'(?=[BbCc])'
+    r'(?:(?P<cg>Covergroup[^\S\n]*:[^\S\n]*(?P<cg_name>.+))'
+    r'|(?P<cp>Coverpoint[^\S\n]*:[^\S\n]*(?P<cp_name>.+))'
+    r'|(?P<bin>Bin[^\S\n]*:[^\S\n]*(?P<bin_name>.+?)[^\S\n]*-[^\S\n]*Hits[^\S\n]*:[^\S\n]*(?P<hits>\d+)'
+    r'[^\S\n]*-[^\S\n]*Status[^\S\n]*:[^\S\n]*(?P<status>\w+))'
+    r'|(?P<cross>Cross[^\S\n]*:[^\S\n]*(?P<cross_name>.+?)[^\S\n]*-[^\S\n]*Coverage[^\S\n]*:[^\S\n]*'
+    r'(?P<cross_pct>\d+\.?\d*)[^\S\n]*%))',
+    re.IGNORECASE
+)
+
 
 class CoverageStatus(Enum):
     """Coverage status enumeration"""
@@ -19,7 +63,18 @@ class CoverageStatus(Enum):
     IGNORED = "ignored"
 
 
-@dataclass
+# Lowercased report status words; anything not listed counts as uncovered
+_STATUS_MAP = {
+    'covered': CoverageStatus.COVERED,
+    'hit': CoverageStatus.COVERED,
+    'hits': CoverageStatus.COVERED,
+    'uncovered': CoverageStatus.UNCOVERED,
+    'ignored': CoverageStatus.IGNORED,
+    'ignore': CoverageStatus.IGNORED,
+}
+
+
+@dataclass(slots=True)
 class Bin:
     """Represents a coverage bin"""
     name: str
@@ -28,7 +83,7 @@ class Bin:
     goal: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Coverpoint:
     """Represents a coverage coverpoint"""
     name: str
@@ -38,7 +93,7 @@ class Coverpoint:
     covered_bins: int
 
 
-@dataclass
+@dataclass(slots=True)
 class CrossCoverage:
     """Represents cross-coverage between coverpoints"""
     name: str
@@ -49,7 +104,7 @@ class CrossCoverage:
     covered_bins: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Covergroup:
     """Represents a coverage covergroup"""
     name: str
@@ -60,7 +115,7 @@ class Covergroup:
     covered_bins: int
 
 
-@dataclass
+@dataclass(slots=True)
 class CoverageReport:
     """Complete coverage report structure"""
     design_name: str
@@ -70,28 +125,31 @@ class CoverageReport:
     uncovered_crosses: List[Dict[str, Any]]
 
 
+class _ReportEncoder(json.JSONEncoder):
+    """
+    JSON encoder for coverage report dataclasses
+    
+    Dataclasses are expanded one level at a time as they are encoded, so no
+    dict copy of the whole report is ever built.
+    """
+    
+    def default(self, obj: Any) -> Any:
+        """Encode CoverageStatus values and report dataclasses"""
+        if isinstance(obj, CoverageStatus):
+            return obj.value
+        if is_dataclass(obj) and not isinstance(obj, type):
+            return {f.name: getattr(obj, f.name) for f in fields(obj)}
+        return super().default(obj)
+
+
 class CoverageReportParser:
     """Parser for functional coverage reports"""
     
-    def __init__(self):
-        self.design_name_pattern = re.compile(r'Design\s*:\s*(.+)', re.IGNORECASE)
-        self.coverage_percentage_pattern = re.compile(r'(\d+\.?\d*)\s*%')
-        self.covergroup_pattern = re.compile(r'Covergroup\s*:\s*(.+)', re.IGNORECASE)
-        self.coverpoint_pattern = re.compile(r'Coverpoint\s*:\s*(.+)', re.IGNORECASE)
-        self.bin_pattern = re.compile(r'Bin\s*:\s*(.+?)\s*-\s*Hits\s*:\s*(\d+)\s*-\s*Status\s*:\s*(\w+)', re.IGNORECASE)
-        self.cross_pattern = re.compile(r'Cross\s*:\s*(.+?)\s*-\s*Coverage\s*:\s*(\d+\.?\d*)\s*%', re.IGNORECASE)
-        
     def parse(self, report_text: str) -> CoverageReport:
         """Parse a coverage report text into structured data"""
-        lines = report_text.split('\n')
-        
-        design_name = self._extract_design_name(lines)
-        overall_coverage = self._extract_overall_coverage(lines)
-        covergroups = self._extract_covergroups(lines)
-        
-        # Extract uncovered bins and crosses
-        uncovered_bins = self._extract_uncovered_bins(covergroups)
-        uncovered_crosses = self._extract_uncovered_crosses(covergroups)
+        design_name = self._extract_design_name(report_text)
+        overall_coverage = self._extract_overall_coverage(report_text)
+        covergroups, uncovered_bins, uncovered_crosses = self._extract_covergroups(report_text)
         
         return CoverageReport(
             design_name=design_name,
@@ -101,40 +159,130 @@ class CoverageReportParser:
             uncovered_crosses=uncovered_crosses
         )
     
-    def _extract_design_name(self, lines: List[str]) -> str:
+    def parse_bytes(self, data: Union[bytes, bytearray, memoryview, mmap.mmap]) -> CoverageReport:
+        """
+        Parse a UTF-8 encoded coverage report held in a bytes-like buffer
+        
+        Line endings are normalized the same way text-mode file reads do,
+        so the result matches parsing the decoded text.
+        
+        Args:
+            data: Raw report contents (e.g. a memory-mapped file)
+        
+        Returns:
+            Parsed CoverageReport
+        """
+        report_text = str(data, 'utf-8')
+        if '\r' in report_text:
+            report_text = report_text.replace('\r\n', '\n').replace('\r', '\n')
+        return self.parse(report_text)
+    
+    def _extract_design_name(self, report_text: str) -> str:
         """Extract design name from report"""
-        for line in lines:
-            match = self.design_name_pattern.search(line)
-            if match:
-                return match.group(1).strip()
+        match = _DESIGN_NAME_RE.search(report_text)
+        if match:
+            return match.group(1).strip()
         return "Unknown Design"
     
-    def _extract_overall_coverage(self, lines: List[str]) -> float:
+    def _extract_overall_coverage(self, report_text: str) -> float:
         """Extract overall coverage percentage"""
-        for line in lines:
-            if 'Overall Coverage' in line or 'Total Coverage' in line:
-                match = self.coverage_percentage_pattern.search(line)
-                if match:
-                    return float(match.group(1))
+        # The percentage may appear anywhere on the labelled line, so search
+        # the whole line around each label rather than just what follows it
+        for label in _OVERALL_LABEL_RE.finditer(report_text):
+            start = report_text.rfind('\n', 0, label.start()) + 1
+            end = report_text.find('\n', label.end())
+            if end == -1:
+                end = len(report_text)
+            match = _COVERAGE_PCT_RE.search(report_text, start, end)
+            if match:
+                return float(match.group(1))
         return 0.0
     
-    def _extract_covergroups(self, lines: List[str]) -> List[Covergroup]:
-        """Extract all covergroups from report"""
-        covergroups = []
-        current_covergroup = None
-        current_coverpoint = None
-        i = 0
+    def _extract_covergroups(
+        self,
+        report_text: str
+    ) -> Tuple[List[Covergroup], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Extract all covergroups from report, along with the uncovered bins
+        and uncovered cross bins
+        
+        The report is scanned once with the combined token pattern. Bins that
+        follow a cross header belong to that cross until the next covergroup,
+        coverpoint or cross token. Uncovered bins are recorded as they are
+        scanned; a coverpoint's percentage is only known once it is finalized,
+        so its entries are back-patched then.
+        
+        Covergroup, coverpoint and cross component names are interned so that
+        names repeated across covergroups and crosses share one string.
+        
+        Returns:
+            Tuple of (covergroups, uncovered_bins, uncovered_crosses)
+        """
+        covergroups: List[Covergroup] = []
+        uncovered_bins: List[Dict[str, Any]] = []
+        uncovered_crosses: List[Dict[str, Any]] = []
+        current_covergroup: Optional[Covergroup] = None
+        current_coverpoint: Optional[Coverpoint] = None
+        # While a cross is open, bin tokens belong to it rather than to the
+        # current coverpoint; any covergroup, coverpoint or cross token closes it
+        current_cross: Optional[CrossCoverage] = None
+        # Uncovered entries of the current coverpoint awaiting its percentage
+        coverpoint_uncovered: List[Dict[str, Any]] = []
         
-        while i < len(lines):
-            line = lines[i]
+        for match in _TOKEN_RE.finditer(report_text):
+            kind = match.lastgroup
             
-            # Check for covergroup
-            covergroup_match = self.covergroup_pattern.search(line)
-            if covergroup_match:
+            if kind == 'bin':
+                if current_covergroup is None:
+                    # Bins before the first covergroup have nowhere to go
+                    continue
+                bin_name = match.group('bin_name').strip()
+                hit_count = int(match.group('hits'))
+                status = _STATUS_MAP.get(match.group('status').lower(), CoverageStatus.UNCOVERED)
+                
+                if current_cross:
+                    current_cross.bins.append(Bin(name=bin_name, hit_count=hit_count, status=status))
+                    if status == CoverageStatus.COVERED:
+                        current_cross.covered_bins += 1
+                    elif status == CoverageStatus.UNCOVERED:
+                        uncovered_crosses.append({
+                            'covergroup': current_covergroup.name,
+                            'cross': current_cross.name,
+                            'coverpoints': current_cross.coverpoints,
+                            'bin': bin_name,
+                            'hit_count': hit_count,
+                            'coverage_percentage': current_cross.coverage_percentage
+                        })
+                elif current_coverpoint:
+                    current_coverpoint.bins.append(Bin(name=bin_name, hit_count=hit_count, status=status))
+                    if status == CoverageStatus.COVERED:
+                        current_coverpoint.covered_bins += 1
+                    elif status == CoverageStatus.UNCOVERED:
+                        entry = {
+                            'covergroup': current_covergroup.name,
+                            'coverpoint': current_coverpoint.name,
+                            'bin': bin_name,
+                            'hit_count': hit_count,
+                            'coverage_percentage': 0.0
+                        }
+                        uncovered_bins.append(entry)
+                        coverpoint_uncovered.append(entry)
+                continue
+            
+            # Any other token ends the current cross
+            if current_cross is not None and current_covergroup is not None:
+                self._finalize_cross(current_covergroup, current_cross)
+                current_cross = None
+            
+            if kind == 'cg':
                 if current_covergroup:
+                    if current_coverpoint:
+                        self._finalize_coverpoint(current_covergroup, current_coverpoint, coverpoint_uncovered)
+                    self._finalize_covergroup(current_covergroup)
                     covergroups.append(current_covergroup)
+                coverpoint_uncovered = []
                 current_covergroup = Covergroup(
-                    name=covergroup_match.group(1).strip(),
+                    name=sys.intern(match.group('cg_name').strip()),
                     coverpoints=[],
                     cross_coverage=[],
                     coverage_percentage=0.0,
@@ -143,176 +291,185 @@ class CoverageReportParser:
                 )
                 current_coverpoint = None
             
-            # Check for coverpoint
-            coverpoint_match = self.coverpoint_pattern.search(line)
-            if coverpoint_match and current_covergroup:
+            elif kind == 'cp' and current_covergroup:
                 if current_coverpoint:
-                    current_covergroup.coverpoints.append(current_coverpoint)
+                    self._finalize_coverpoint(current_covergroup, current_coverpoint, coverpoint_uncovered)
+                coverpoint_uncovered = []
                 current_coverpoint = Coverpoint(
-                    name=coverpoint_match.group(1).strip(),
+                    name=sys.intern(match.group('cp_name').strip()),
                     bins=[],
                     coverage_percentage=0.0,
                     total_bins=0,
                     covered_bins=0
                 )
             
-            # Check for bin
-            bin_match = self.bin_pattern.search(line)
-            if bin_match and current_coverpoint:
-                bin_name = bin_match.group(1).strip()
-                hit_count = int(bin_match.group(2))
-                status_str = bin_match.group(3).strip().lower()
-                
-                status = CoverageStatus.UNCOVERED
-                if status_str == 'covered' or 'hit' in status_str:
-                    status = CoverageStatus.COVERED
-                elif 'ignore' in status_str:
-                    status = CoverageStatus.IGNORED
-                
-                bin_obj = Bin(
-                    name=bin_name,
-                    hit_count=hit_count,
-                    status=status
-                )
-                current_coverpoint.bins.append(bin_obj)
-            
-            # Check for cross coverage
-            cross_match = self.cross_pattern.search(line)
-            if cross_match and current_covergroup:
-                cross_name = cross_match.group(1).strip()
-                cross_coverage = float(cross_match.group(2))
+            elif kind == 'cross' and current_covergroup:
+                cross_name = match.group('cross_name').strip()
                 
                 # Extract coverpoints from cross name (e.g., "cp1 x cp2")
-                coverpoint_names = [cp.strip() for cp in cross_name.split('x')]
-                
-                # Find bins for this cross (simplified - in real parser, would parse actual cross bins)
-                cross_bins = []
-                i += 1
-                while i < len(lines) and not self.covergroup_pattern.search(lines[i]) and not self.coverpoint_pattern.search(lines[i]):
-                    bin_match = self.bin_pattern.search(lines[i])
-                    if bin_match:
-                        bin_name = bin_match.group(1).strip()
-                        hit_count = int(bin_match.group(2))
-                        status_str = bin_match.group(3).strip().lower()
-                        
-                        status = CoverageStatus.UNCOVERED
-                        if 'cover' in status_str or 'hit' in status_str:
-                            status = CoverageStatus.COVERED
-                        elif 'ignore' in status_str:
-                            status = CoverageStatus.IGNORED
-                        
-                        cross_bins.append(Bin(
-                            name=bin_name,
-                            hit_count=hit_count,
-                            status=status
-                        ))
-                    i += 1
-                i -= 1
+                coverpoint_names = [sys.intern(cp.strip()) for cp in cross_name.split('x')]
                 
-                total_cross_bins = len(cross_bins)
-                covered_cross_bins = sum(1 for b in cross_bins if b.status == CoverageStatus.COVERED)
-                
-                cross_coverage_obj = CrossCoverage(
+                current_cross = CrossCoverage(
                     name=cross_name,
                     coverpoints=coverpoint_names,
-                    bins=cross_bins,
-                    coverage_percentage=cross_coverage,
-                    total_bins=total_cross_bins,
-                    covered_bins=covered_cross_bins
+                    bins=[],
+                    coverage_percentage=float(match.group('cross_pct')),
+                    total_bins=0,
+                    covered_bins=0
                 )
-                current_covergroup.cross_coverage.append(cross_coverage_obj)
-            
-            # Update coverpoint statistics
-            if current_coverpoint and i == len(lines) - 1:
-                current_coverpoint.total_bins = len(current_coverpoint.bins)
-                current_coverpoint.covered_bins = sum(1 for b in current_coverpoint.bins if b.status == CoverageStatus.COVERED)
-                if current_coverpoint.total_bins > 0:
-                    current_coverpoint.coverage_percentage = (current_coverpoint.covered_bins / current_coverpoint.total_bins) * 100
-            
-            i += 1
+                current_covergroup.cross_coverage.append(current_cross)
         
-        # Add last coverpoint and covergroup
-        if current_coverpoint and current_covergroup:
-            current_coverpoint.total_bins = len(current_coverpoint.bins)
-            current_coverpoint.covered_bins = sum(1 for b in current_coverpoint.bins if b.status == CoverageStatus.COVERED)
-            if current_coverpoint.total_bins > 0:
-                current_coverpoint.coverage_percentage = (current_coverpoint.covered_bins / current_coverpoint.total_bins) * 100
-            current_covergroup.coverpoints.append(current_coverpoint)
+        # Close out whatever is still open at the end of the report
+        if current_cross is not None and current_covergroup is not None:
+            self._finalize_cross(current_covergroup, current_cross)
         
         if current_covergroup:
-            # Calculate covergroup statistics
-            all_bins = []
-            for cp in current_covergroup.coverpoints:
-                all_bins.extend(cp.bins)
-            for cross in current_covergroup.cross_coverage:
-                all_bins.extend(cross.bins)
-            
-            current_covergroup.total_bins = len(all_bins)
-            current_covergroup.covered_bins = sum(1 for b in all_bins if b.status == CoverageStatus.COVERED)
-            if current_covergroup.total_bins > 0:
-                current_covergroup.coverage_percentage = (current_covergroup.covered_bins / current_covergroup.total_bins) * 100
-            
+            if current_coverpoint:
+                self._finalize_coverpoint(current_covergroup, current_coverpoint, coverpoint_uncovered)
+            self._finalize_covergroup(current_covergroup)
             covergroups.append(current_covergroup)
         
-        return covergroups
+        return covergroups, uncovered_bins, uncovered_crosses
     
-    def _extract_uncovered_bins(self, covergroups: List[Covergroup]) -> List[Dict[str, Any]]:
-        """Extract all uncovered bins with context"""
-        uncovered = []
-        for cg in covergroups:
-            for cp in cg.coverpoints:
-                for bin_obj in cp.bins:
-                    if bin_obj.status == CoverageStatus.UNCOVERED:
-                        uncovered.append({
-                            'covergroup': cg.name,
-                            'coverpoint': cp.name,
-                            'bin': bin_obj.name,
-                            'hit_count': bin_obj.hit_count,
-                            'coverage_percentage': cp.coverage_percentage
-                        })
-        return uncovered
+    def _finalize_coverpoint(
+        self,
+        covergroup: Covergroup,
+        coverpoint: Coverpoint,
+        uncovered: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Compute coverpoint statistics and add the coverpoint to its covergroup
+        
+        Covered bins are counted during the scan. Also fills in the percentage
+        of the coverpoint's uncovered bin entries and adds its counts to the
+        covergroup totals.
+        """
+        coverpoint.total_bins = len(coverpoint.bins)
+        if coverpoint.total_bins > 0:
+            coverpoint.coverage_percentage = (coverpoint.covered_bins / coverpoint.total_bins) * 100
+        for entry in uncovered:
+            entry['coverage_percentage'] = coverpoint.coverage_percentage
+        covergroup.coverpoints.append(coverpoint)
+        covergroup.total_bins += coverpoint.total_bins
+        covergroup.covered_bins += coverpoint.covered_bins
     
-    def _extract_uncovered_crosses(self, covergroups: List[Covergroup]) -> List[Dict[str, Any]]:
-        """Extract all uncovered cross-coverage combinations"""
-        uncovered = []
-        for cg in covergroups:
-            for cross in cg.cross_coverage:
-                for bin_obj in cross.bins:
-                    if bin_obj.status == CoverageStatus.UNCOVERED:
-                        uncovered.append({
-                            'covergroup': cg.name,
-                            'cross': cross.name,
-                            'coverpoints': cross.coverpoints,
-                            'bin': bin_obj.name,
-                            'hit_count': bin_obj.hit_count,
-                            'coverage_percentage': cross.coverage_percentage
-                        })
-        return uncovered
+    def _finalize_cross(self, covergroup: Covergroup, cross: CrossCoverage) -> None:
+        """Compute cross bin counts and add them to the covergroup totals"""
+        # The cross percentage is taken from the report, not recomputed
+        cross.total_bins = len(cross.bins)
+        covergroup.total_bins += cross.total_bins
+        covergroup.covered_bins += cross.covered_bins
+    
+    def _finalize_covergroup(self, covergroup: Covergroup) -> None:
+        """Compute the covergroup percentage from its running bin totals"""
+        if covergroup.total_bins > 0:
+            covergroup.coverage_percentage = (covergroup.covered_bins / covergroup.total_bins) * 100
     
     def to_json(self, report: CoverageReport) -> str:
         """Convert coverage report to JSON string"""
-        def convert_to_dict(obj):
-            if isinstance(obj, CoverageStatus):
-                return obj.value
-            if hasattr(obj, '__dict__'):
-                result = {}
-                for key, value in obj.__dict__.items():
-                    if isinstance(value, list):
-                        result[key] = [convert_to_dict(item) for item in value]
-                    elif isinstance(value, CoverageStatus):
-                        result[key] = value.value
-                    else:
-                        result[key] = value
-                return result
-            return obj
+        if ORJSON_AVAILABLE:
+            # orjson encodes dataclasses and enums natively
+            return orjson.dumps(report, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(report, indent=2, ensure_ascii=False, cls=_ReportEncoder)
+    
+    def to_json_file(self, report: CoverageReport, fp: TextIO) -> None:
+        """
+        Write coverage report JSON to a text file object
         
-        report_dict = convert_to_dict(report)
-        return json.dumps(report_dict, indent=2)
+        Uses the same encoder as to_json, so the output is identical. Without
+        orjson the JSON is written in chunks as it is encoded, so neither the
+        full JSON string nor a dict copy of the report is held in memory;
+        orjson has no incremental API and encodes the whole report at once.
+        
+        Args:
+            report: Parsed coverage report
+            fp: Text-mode file object to write to
+        """
+        if ORJSON_AVAILABLE:
+            fp.write(self.to_json(report))
+            return
+        for chunk in _ReportEncoder(indent=2, ensure_ascii=False).iterencode(report):
+            fp.write(chunk)
+
+
+def parse_coverage_report(file_path: Union[str, Path]) -> CoverageReport:
+    """
+    Convenience function to parse a coverage report from file
+    
+    Results are memoized in-process on the resolved path and the file's
+    modification time and size, so re-parsing an unchanged file is free.
+    The returned report is shared between callers and must not be mutated.
+    """
+    path = Path(file_path).resolve()
+    stat = path.stat()
+    return _parse_coverage_report_file(str(path), stat.st_mtime_ns, stat.st_size)
 
 
-def parse_coverage_report(file_path: str) -> CoverageReport:
-    """Convenience function to parse a coverage report from file"""
+@functools.lru_cache(maxsize=32)
+def _parse_coverage_report_file(path: str, mtime_ns: int, size: int) -> CoverageReport:
+    """Parse the report at path; mtime_ns and size only key the cache"""
     parser = CoverageReportParser()
-    with open(file_path, 'r') as f:
-        report_text = f.read()
-    return parser.parse(report_text)
+    if size == 0:
+        # mmap cannot map an empty file
+        return parser.parse('')
+    # Decode straight from the mapped pages instead of reading the whole
+    # file into a bytes object first
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return parser.parse_bytes(mm)
+
+
+def _remove_stale_cache_entries() -> None:
+    """Delete cache entries written by other cache versions (best effort)"""
+    current_suffix = f".v{_CACHE_VERSION}.pkl"
+    for entry in _CACHE_DIR.glob('*.pkl'):
+        if not entry.name.endswith(current_suffix):
+            try:
+                entry.unlink()
+            except OSError:
+                pass
+
+
+def parse_coverage_report_cached(file_path: Union[str, Path]) -> CoverageReport:
+    """
+    Parse a coverage report from file, reusing a previously cached result
+    
+    Parsed reports are pickled under ~/.cache/cov_analyzer, keyed by the
+    SHA-256 of the file contents, so identical reports are parsed only once.
+    Entries from older cache versions are deleted whenever a new entry is
+    written. Set COV_ANALYZER_NO_CACHE=1 to bypass the cache.
+    """
+    if os.environ.get('COV_ANALYZER_NO_CACHE') == '1':
+        return parse_coverage_report(file_path)
+    
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    cache_file = _CACHE_DIR / f"{digest.hexdigest()}.v{_CACHE_VERSION}.pkl"
+    
+    try:
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        # Missing or unreadable cache entry: fall through and parse
+        pass
+    
+    report = parse_coverage_report(file_path)
+    
+    # Write to a temporary file and rename so readers never see partial entries
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=_CACHE_DIR, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(report, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        _remove_stale_cache_entries()
+    except OSError:
+        # Caching is best effort (e.g. read-only home directory)
+        pass
+    
+    return report
@@ -4,10 +4,29 @@ This module implements the prioritization algorithm that ranks test suggestions
 based on coverage impact, difficulty, and dependencies.
 """
 
-from typing import List
+from collections import Counter
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Dict, List, Literal, Tuple, Union, overload
 from src.llm_integration import TestSuggestion, DifficultyLevel
 
 
+# Inverse difficulty score per level (easier tests score higher)
+_INVERSE_DIFFICULTY = {
+    DifficultyLevel.EASY: 1.0,
+    DifficultyLevel.MEDIUM: 0.7,
+    DifficultyLevel.HARD: 0.4,
+    DifficultyLevel.VERY_HARD: 0.2
+}
+
+
+@dataclass(slots=True)
+class SuggestionStats:
+    """Aggregate statistics gathered while prioritizing suggestions"""
+    total_time_hours: float
+    difficulty_counts: Dict[DifficultyLevel, int]
+
+
 class Prioritizer:
     """Prioritizes test suggestions based on multiple factors"""
     
@@ -36,129 +55,155 @@ class Prioritizer:
             self.difficulty_weight /= total_weight
             self.dependency_weight /= total_weight
     
-    def prioritize(self, suggestions: List[TestSuggestion]) -> List[TestSuggestion]:
+    @overload
+    def prioritize(
+        self,
+        suggestions: List[TestSuggestion],
+        return_stats: Literal[False] = False
+    ) -> List[TestSuggestion]: ...
+    
+    @overload
+    def prioritize(
+        self,
+        suggestions: List[TestSuggestion],
+        return_stats: Literal[True]
+    ) -> Tuple[List[TestSuggestion], SuggestionStats]: ...
+    
+    @overload
+    def prioritize(
+        self,
+        suggestions: List[TestSuggestion],
+        return_stats: bool = False
+    ) -> Union[List[TestSuggestion], Tuple[List[TestSuggestion], SuggestionStats]]: ...
+    
+    def prioritize(
+        self,
+        suggestions: List[TestSuggestion],
+        return_stats: bool = False
+    ) -> Union[List[TestSuggestion], Tuple[List[TestSuggestion], SuggestionStats]]:
         """
         Prioritize test suggestions and return sorted list
         
         Args:
             suggestions: List of test suggestions to prioritize
+            return_stats: Also return SuggestionStats gathered while scoring
         
         Returns:
-            Sorted list of test suggestions by priority score (highest first)
+            Sorted list of test suggestions by priority score (highest first),
+            or a (suggestions, stats) tuple if return_stats is set
         """
-        # Calculate priority scores
-        for suggestion in suggestions:
-            suggestion.priority_score = self._calculate_priority_score(suggestion)
+        # Calculate priority scores, collecting statistics in the same pass
+        scores = self._calculate_priority_scores(suggestions)
+        total_time = 0.0
+        difficulty_counts: Dict[DifficultyLevel, int] = Counter()
+        for suggestion, score in zip(suggestions, scores):
+            suggestion.priority_score = score
+            total_time += suggestion.estimated_time_hours
+            difficulty_counts[suggestion.difficulty] += 1
         
         # Sort by priority score (descending)
         sorted_suggestions = sorted(
             suggestions,
-            key=lambda s: s.priority_score,
+            key=attrgetter('priority_score'),
             reverse=True
         )
         
+        if return_stats:
+            return sorted_suggestions, SuggestionStats(
+                total_time_hours=total_time,
+                difficulty_counts=difficulty_counts
+            )
         return sorted_suggestions
     
-    def _calculate_priority_score(self, suggestion: TestSuggestion) -> float:
+    def _calculate_priority_scores(self, suggestions: List[TestSuggestion]) -> List[float]:
         """
-        Calculate priority score for a test suggestion
+        Calculate priority scores for a batch of test suggestions
         
         Formula: 
         priority_score = (coverage_impact_weight * coverage_impact) +
                         (difficulty_weight * inverse_difficulty) +
                         (dependency_weight * dependency_score)
         
-        Args:
-            suggestion: Test suggestion to score
+        Components (each 0-1):
+        - Coverage impact: 1 - coverpoint coverage, boosted by 1.2 for
+          cross-coverage bins (lower coverage = higher impact)
+        - Inverse difficulty: Easy 1.0, Medium 0.7, Hard 0.4, Very Hard 0.2
+          (unknown levels 0.5)
+        - Dependency score: 1.0 / (1 + num_dependencies)
         
-        Returns:
-            Priority score (0-1, higher is better)
-        """
-        # Coverage impact: based on how much coverage this bin contributes
-        coverage_impact = self._calculate_coverage_impact(suggestion)
+        The components are computed inline and the weights are read once,
+        since this loop runs for every suggestion.
         
-        # Inverse difficulty: easier tests get higher scores
-        inverse_difficulty = self._calculate_inverse_difficulty(suggestion)
-        
-        # Dependency score: fewer dependencies = higher score
-        dependency_score = self._calculate_dependency_score(suggestion)
-        
-        # Calculate weighted score
-        priority_score = (
-            self.coverage_impact_weight * coverage_impact +
-            self.difficulty_weight * inverse_difficulty +
-            self.dependency_weight * dependency_score
-        )
-        
-        return priority_score
-    
-    def _calculate_coverage_impact(self, suggestion: TestSuggestion) -> float:
-        """
-        Calculate coverage impact score
-        
-        Higher impact if:
-        - Bin is in a coverpoint with low coverage
-        - Bin is part of cross-coverage
-        - Bin represents a critical functionality
-        
-        Returns:
-            Coverage impact score (0-1)
-        """
-        bin_info = suggestion.uncovered_bin
-        
-        # Base score from coverpoint coverage (lower coverage = higher impact)
-        coverpoint_coverage = bin_info.get('coverage_percentage', 0) / 100.0
-        impact = 1.0 - coverpoint_coverage  # Invert: lower coverage = higher impact
-        
-        # Boost for cross-coverage bins
-        if 'cross' in bin_info or 'coverpoints' in bin_info:
-            impact = min(1.0, impact * 1.2)
-        
-        # Normalize to 0-1 range
-        return min(1.0, max(0.0, impact))
-    
-    def _calculate_inverse_difficulty(self, suggestion: TestSuggestion) -> float:
-        """
-        Calculate inverse difficulty score
-        
-        Easier tests get higher scores:
-        - Easy: 1.0
-        - Medium: 0.7
-        - Hard: 0.4
-        - Very Hard: 0.2
+        Args:
+            suggestions: Test suggestions to score
         
         Returns:
-            Inverse difficulty score (0-1)
+            Priority scores (0-1, higher is better) in the same order as
+            suggestions
         """
-        difficulty_map = {
-            DifficultyLevel.EASY: 1.0,
-            DifficultyLevel.MEDIUM: 0.7,
-            DifficultyLevel.HARD: 0.4,
-            DifficultyLevel.VERY_HARD: 0.2
-        }
-        
-        return difficulty_map.get(suggestion.difficulty, 0.5)
-    
-    def _calculate_dependency_score(self, suggestion: TestSuggestion) -> float:
-        """
-        Calculate dependency score
-        
-        Fewer dependencies = higher score
-        Score = 1.0 / (1 + num_dependencies)
+        coverage_impact_weight = self.coverage_impact_weight
+        difficulty_weight = self.difficulty_weight
+        dependency_weight = self.dependency_weight
+        inverse_difficulty = _INVERSE_DIFFICULTY.get
         
-        Returns:
-            Dependency score (0-1)
-        """
-        num_dependencies = len(suggestion.dependencies)
-        return 1.0 / (1.0 + num_dependencies)
+        scores = []
+        for suggestion in suggestions:
+            bin_info = suggestion.uncovered_bin
+            
+            # Coverage impact: lower coverpoint coverage = higher impact,
+            # with a boost for cross-coverage bins
+            impact = 1.0 - bin_info.get('coverage_percentage', 0) / 100.0
+            if 'cross' in bin_info or 'coverpoints' in bin_info:
+                impact = min(1.0, impact * 1.2)
+            impact = min(1.0, max(0.0, impact))
+            
+            scores.append(
+                coverage_impact_weight * impact +
+                difficulty_weight * inverse_difficulty(suggestion.difficulty, 0.5) +
+                dependency_weight * (1.0 / (1.0 + len(suggestion.dependencies)))
+            )
+        
+        return scores
+
+
+@overload
+def prioritize_suggestions(
+    suggestions: List[TestSuggestion],
+    coverage_impact_weight: float = 0.5,
+    difficulty_weight: float = 0.3,
+    dependency_weight: float = 0.2,
+    return_stats: Literal[False] = False
+) -> List[TestSuggestion]: ...
+
+
+@overload
+def prioritize_suggestions(
+    suggestions: List[TestSuggestion],
+    coverage_impact_weight: float = 0.5,
+    difficulty_weight: float = 0.3,
+    dependency_weight: float = 0.2,
+    *,
+    return_stats: Literal[True]
+) -> Tuple[List[TestSuggestion], SuggestionStats]: ...
+
+
+@overload
+def prioritize_suggestions(
+    suggestions: List[TestSuggestion],
+    coverage_impact_weight: float = 0.5,
+    difficulty_weight: float = 0.3,
+    dependency_weight: float = 0.2,
+    return_stats: bool = False
+) -> Union[List[TestSuggestion], Tuple[List[TestSuggestion], SuggestionStats]]: ...
 
 
 def prioritize_suggestions(
     suggestions: List[TestSuggestion],
     coverage_impact_weight: float = 0.5,
     difficulty_weight: float = 0.3,
-    dependency_weight: float = 0.2
-) -> List[TestSuggestion]:
+    dependency_weight: float = 0.2,
+    return_stats: bool = False
+) -> Union[List[TestSuggestion], Tuple[List[TestSuggestion], SuggestionStats]]:
     """
     Convenience function to prioritize test suggestions
     
@@ -167,13 +212,15 @@ def prioritize_suggestions(
         coverage_impact_weight: Weight for coverage impact
         difficulty_weight: Weight for inverse difficulty
         dependency_weight: Weight for dependency score
+        return_stats: Also return SuggestionStats for the suggestions
     
     Returns:
-        Sorted list of prioritized suggestions
+        Sorted list of prioritized suggestions, or a (suggestions, stats)
+        tuple if return_stats is set
     """
     prioritizer = Prioritizer(
         coverage_impact_weight=coverage_impact_weight,
         difficulty_weight=difficulty_weight,
         dependency_weight=dependency_weight
     )
-    return prioritizer.prioritize(suggestions)
+    return prioritizer.prioritize(suggestions, return_stats=return_stats)